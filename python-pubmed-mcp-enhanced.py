@@ -8,10 +8,19 @@ import asyncio
 import json
 import logging
 import os
+import random
+import re
 import sys
 import argparse
-from typing import Dict, List, Optional, Any, Union
+from contextlib import asynccontextmanager
+from io import BytesIO
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Any, Union
 import aiohttp
+import anyio
+import orjson
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+from lxml import etree as LET
 from pydantic import BaseModel, Field, validator
 from mcp.server.fastmcp import FastMCP
 
@@ -23,8 +32,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger("pubmed-mcp")
 
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the HTTP session when the server stops, on the loop that owns its connections."""
+    try:
+        yield
+    finally:
+        # Shielded so the close still completes when shutdown cancels the server
+        with anyio.CancelScope(shield=True):
+            await close_session()
+
 # Initialize MCP server
-mcp = FastMCP("pubmed-mcp")
+mcp = FastMCP("pubmed-mcp", lifespan=lifespan)
 
 # Define constants
 BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
@@ -41,11 +60,50 @@ EMAIL = os.environ.get("NCBI_EMAIL", "")
 # With API key, you can make up to 10 requests per second instead of 3
 # And up to 300 requests instead of 100 per IP address before getting blocked
 API_REQUESTS_PER_SECOND = 10 if API_KEY else 3
-API_RATE_LIMITER = asyncio.Semaphore(API_REQUESTS_PER_SECOND)
+API_RATE_LIMITER = AsyncLimiter(API_REQUESTS_PER_SECOND, 1)
+
+# With API key, up to 200 results per request instead of 100
+MAX_RESULTS = 200 if API_KEY else 100
+
+# Search field tags used by pubmed_advanced_search
+FIELD_MAPPINGS = {
+    "author": "[Author]",
+    "journal": "[Journal]",
+    "year": "[Publication Date]",
+    "title": "[Title]",
+    "mesh": "[MeSH Terms]",
+    "affiliation": "[Affiliation]",
+    "doi": "[DOI]",
+    "keyword": "[Keyword]"
+}
+
+# Matches a trailing PubMed field tag such as "[Author]"
+FIELD_TAG = re.compile(r"\[[A-Za-z ]+\]\s*$")
+
+# XML parsing objects shared by every call
+XML_PARSER = LET.XMLParser(huge_tree=True, remove_blank_text=True)
+ABSTRACT_XPATH = LET.XPath("//Abstract/AbstractText")
+
+# JATS block elements that can sit inside a <p> without being part of its prose
+PARAGRAPH_BLOCK_TAGS = frozenset({
+    "p", "fig", "fig-group", "table-wrap", "table-wrap-group", "list", "def-list",
+    "disp-quote", "disp-formula", "disp-formula-group", "boxed-text", "statement",
+    "supplementary-material", "chem-struct-wrap", "preformat", "code", "speech", "verse-group"
+})
+
+# HTTP statuses NCBI uses to ask clients to slow down, and the longest
+# Retry-After we honour so a throttled call can't stall a tool indefinitely
+THROTTLE_STATUSES = (429, 503)
+MAX_RETRY_AFTER = 30
 
 # Global HTTP session
 session = None
 
+# In-process caches so PMIDs seen recently don't cost another API call
+PAPER_CACHE = TTLCache(maxsize=50_000, ttl=3600)
+OPEN_ACCESS_CACHE = TTLCache(maxsize=10_000, ttl=600)
+ABSTRACT_CACHE = TTLCache(maxsize=10_000, ttl=600)
+
 # Define data models
 class PubmedPaper(BaseModel):
     """Model for a PubMed paper."""
@@ -53,7 +111,7 @@ class PubmedPaper(BaseModel):
     authors: str
     pubDate: str
     pmid: int
-    pmc: Optional[int] = None
+    pmc: Optional[str] = None  # PMC ID as published, e.g. "PMC1234567"
     doi: Optional[str] = None
     journal: Optional[str] = None  # Added journal information
 
@@ -68,7 +126,20 @@ async def get_session() -> aiohttp.ClientSession:
     global session
     if session is None or session.closed:
         timeout = aiohttp.ClientTimeout(total=30)
-        session = aiohttp.ClientSession(timeout=timeout)
+        # All E-utilities traffic goes to a single host, so keep connections
+        # and DNS lookups warm instead of paying a TLS handshake per request
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={"Accept-Encoding": "gzip, deflate"}
+        )
     return session
 
 async def close_session() -> None:
@@ -90,111 +161,170 @@ async def fetch_with_retry(url: str, params: Dict, max_retries: int = 3) -> Any:
     if EMAIL:
         params["email"] = EMAIL
     
-    async with API_RATE_LIMITER:
-        while retry_count < max_retries:
-            try:
-                async with session.get(url, params=params) as response:
+    while retry_count < max_retries:
+        try:
+            # Only an attempt's start consumes a rate-limit token; the session's
+            # connector (limit_per_host) caps how many requests are in flight
+            await API_RATE_LIMITER.acquire()
+            async with session.get(url, params=params) as response:
+                status = response.status
+                if status in THROTTLE_STATUSES and retry_count + 1 < max_retries:
+                    retry_after = response.headers.get("Retry-After")
+                else:
                     response.raise_for_status()
                     content_type = response.headers.get("Content-Type", "")
                     
                     if "application/json" in content_type:
-                        return await response.json()
-                    elif "text/xml" in content_type or "application/xml" in content_type:
-                        return await response.text()
-                    else:
-                        return await response.read()
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                retry_count += 1
-                if retry_count >= max_retries:
-                    raise
-                logger.warning(f"Request failed, retrying ({retry_count}/{max_retries}): {str(e)}")
-                await asyncio.sleep(backoff)
-                backoff *= 2
-
-def extract_pubmed_papers(data: Dict) -> List[PubmedPaper]:
-    """Extract PubMed papers from API response."""
-    papers = []
-    if "esearchresult" not in data or "idlist" not in data["esearchresult"]:
-        return papers
+                        return orjson.loads(await response.read())
+                    # Anything else (XML) stays raw bytes so lxml can parse it without a decode
+                    return await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            retry_count += 1
+            if retry_count >= max_retries:
+                raise
+            logger.warning(f"Request failed, retrying ({retry_count}/{max_retries}): {str(e)}")
+            # Full jitter keeps concurrent failures from retrying in lockstep
+            await asyncio.sleep(random.uniform(0, backoff))
+        else:
+            # Only reached when NCBI asked us to slow down
+            retry_count += 1
+            logger.warning(f"Request throttled (HTTP {status}), retrying ({retry_count}/{max_retries})")
+            await asyncio.sleep(retry_after_delay(retry_after, backoff))
+        backoff *= 2
+
+def retry_after_delay(retry_after: Optional[str], backoff: float) -> float:
+    """Seconds to wait before retrying, honouring a numeric Retry-After header up to MAX_RETRY_AFTER."""
+    try:
+        return min(max(0.0, float(retry_after)), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return random.uniform(0, backoff)
+
+def parse_paper(pmid: str, article: Dict) -> PubmedPaper:
+    """Build a PubmedPaper from a single esummary record."""
+    # Extract authors
+    authors = [
+        author["name"]
+        for author in article.get("authors", ())
+        if author.get("authtype") == "Author" and "name" in author
+    ]
     
-    pmids = data["esearchresult"]["idlist"]
-    return papers
+    authors_str = ", ".join(authors[:5])  # Limit to first 5 authors for brevity
+    if len(authors) > 5:
+        authors_str += f" et al. ({len(authors) - 5} more)"
+    
+    # Extract DOI and PMC ID in a single pass over the article IDs
+    doi = None
+    pmc = None
+    for id_obj in article.get("articleids", ()):
+        idtype = id_obj.get("idtype")
+        if idtype == "doi" and doi is None:
+            doi = id_obj.get("value")
+        elif idtype == "pmc" and pmc is None:
+            pmc = id_obj.get("value")
+        if doi and pmc:
+            break
+    
+    return PubmedPaper(
+        title=article.get("title", "N/A"),
+        authors=authors_str or "N/A",
+        pubDate=article.get("pubdate", "N/A"),
+        pmid=int(pmid),
+        pmc=pmc,
+        doi=doi,
+        journal=article.get("fulljournalname", article.get("source", "N/A"))
+    )
+
+def paragraph_text(elem: Any) -> str:
+    """
+    Return the text of a paragraph element, keeping inline markup such as <italic>
+    or <xref> but leaving out block descendants like figures, tables and lists.
+    """
+    parts = [elem.text or ""]
+    for child in elem:
+        if isinstance(child.tag, str) and child.tag not in PARAGRAPH_BLOCK_TAGS:
+            parts.append(paragraph_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
 
 async def fetch_paper_details(pmids: List[str]) -> List[PubmedPaper]:
     """Fetch details for a list of PubMed IDs."""
     if not pmids:
         return []
     
+    # Drop duplicate PMIDs, keeping the first occurrence's position
+    pmids = list(dict.fromkeys(str(pmid) for pmid in pmids))
+    
+    # Only request summaries for PMIDs that aren't already cached
+    papers_by_pmid = {}
+    missing = []
+    for pmid in pmids:
+        paper = PAPER_CACHE.get(pmid)
+        if paper is None:
+            missing.append(pmid)
+        else:
+            papers_by_pmid[pmid] = paper
+    
     # For better performance, split large batches of PMIDs into smaller chunks
     batch_size = 200  # Increased from typical 50 to 200 with API key
-    papers = []
+    batches = [missing[i:i+batch_size] for i in range(0, len(missing), batch_size)]
     
-    for i in range(0, len(pmids), batch_size):
-        batch_pmids = pmids[i:i+batch_size]
-        
-        # Fetch summary data for the PMIDs
-        summary_url = f"{BASE_URL}/esummary.fcgi"
-        summary_params = {
+    # Fetch summary data for all batches concurrently; the rate limiter paces them
+    summary_url = f"{BASE_URL}/esummary.fcgi"
+    summaries = await asyncio.gather(*[
+        fetch_with_retry(summary_url, {
             "db": "pubmed",
             "id": ",".join(batch_pmids),
             "retmode": "json"
-        }
-        
-        summary_data = await fetch_with_retry(summary_url, summary_params)
-        
+        })
+        for batch_pmids in batches
+    ], return_exceptions=True)
+    
+    for batch_pmids, summary_data in zip(batches, summaries):
+        if isinstance(summary_data, BaseException):
+            continue
         for pmid in batch_pmids:
             if pmid in summary_data.get("result", {}) and pmid != "uids":
-                article = summary_data["result"][pmid]
-                
-                # Extract authors
-                authors = []
-                for author in article.get("authors", []):
-                    if author.get("authtype") == "Author" and "name" in author:
-                        authors.append(author["name"])
-                
-                authors_str = ", ".join(authors[:5])  # Limit to first 5 authors for brevity
-                if len(authors) > 5:
-                    authors_str += f" et al. ({len(authors) - 5} more)"
-                
-                # Extract DOI
-                doi = None
-                articleids = article.get("articleids", [])
-                for id_obj in articleids:
-                    if id_obj.get("idtype") == "doi":
-                        doi = id_obj.get("value")
-                        break
-                
-                # Extract PMC ID
-                pmc = None
-                for id_obj in articleids:
-                    if id_obj.get("idtype") == "pmc":
-                        pmc_value = id_obj.get("value", "")
-                        if pmc_value.startswith("PMC"):
-                            try:
-                                pmc = int(pmc_value[3:])
-                            except ValueError:
-                                pass
-                        break
-                
-                paper = PubmedPaper(
-                    title=article.get("title", "N/A"),
-                    authors=authors_str or "N/A",
-                    pubDate=article.get("pubdate", "N/A"),
-                    pmid=int(pmid),
-                    pmc=pmc,
-                    doi=doi,
-                    journal=article.get("fulljournalname", article.get("source", "N/A"))
-                )
-                papers.append(paper)
+                paper = parse_paper(pmid, summary_data["result"][pmid])
+                papers_by_pmid[pmid] = paper
+                PAPER_CACHE[pmid] = paper
+    
+    # Batches that succeeded are cached above, so a retry only refetches the failed ones
+    for summary_data in summaries:
+        if isinstance(summary_data, BaseException):
+            raise summary_data
+    
+    return [papers_by_pmid[pmid] for pmid in pmids if pmid in papers_by_pmid]
+
+async def fetch_paper_details_by_history(web_env: str, query_key: str, retstart: int, retmax: int) -> List[PubmedPaper]:
+    """Fetch details for a result set stored on the E-utilities history server."""
+    summary_url = f"{BASE_URL}/esummary.fcgi"
+    summary_params = {
+        "db": "pubmed",
+        "WebEnv": web_env,
+        "query_key": query_key,
+        "retstart": retstart,
+        "retmax": retmax,
+        "retmode": "json"
+    }
+    
+    summary_data = await fetch_with_retry(summary_url, summary_params)
+    
+    result = summary_data.get("result", {})
+    papers = []
+    for pmid in result.get("uids", []):
+        if pmid in result:
+            paper = parse_paper(pmid, result[pmid])
+            PAPER_CACHE[pmid] = paper
+            papers.append(paper)
     
     return papers
 
-async def fetch_papers_in_batches(func_name: str, ids: List[int], batch_size: int = 100) -> List[Any]:
+async def fetch_papers_in_batches(func: Callable[[int], Awaitable[Any]], ids: List[int], batch_size: int = 100) -> List[Any]:
     """Fetch papers in batches to avoid overloading the API."""
     results = []
     for i in range(0, len(ids), batch_size):
         batch = ids[i:i+batch_size]
-        tasks = [globals()[func_name](id) for id in batch]
+        tasks = [func(id) for id in batch]
         batch_results = await asyncio.gather(*tasks, return_exceptions=True)
         
         for result in batch_results:
@@ -203,6 +333,25 @@ async def fetch_papers_in_batches(func_name: str, ids: List[int], batch_size: in
     
     return results
 
+async def esearch(query: str, retstart: int, retmax: int) -> Optional[Dict]:
+    """Run a PubMed esearch and return its esearchresult block, or None if the response is invalid."""
+    search_url = f"{BASE_URL}/esearch.fcgi"
+    search_params = {
+        "db": "pubmed",
+        "term": query,
+        "retmode": "json",
+        "retmax": retmax,
+        "retstart": retstart,
+        "sort": "relevance",  # Sort by relevance
+        "usehistory": "y"     # Use WebEnv and QueryKey for faster subsequent requests
+    }
+    
+    search_data = await fetch_with_retry(search_url, search_params)
+    
+    if "esearchresult" not in search_data:
+        return None
+    return search_data["esearchresult"]
+
 # MCP Tool implementations
 @mcp.tool()
 async def pubmed_search(query: str, page: Optional[int] = None, limit: Optional[int] = None) -> Dict:
@@ -215,38 +364,33 @@ async def pubmed_search(query: str, page: Optional[int] = None, limit: Optional[
     try:
         # Default values
         page = max(1, page or 1)
-        limit = max(1, min(200 if API_KEY else 100, limit or 10))  # Default 10, max 100/200
+        limit = max(1, min(MAX_RESULTS, limit or 10))  # Default 10, max 100/200
         
         # Calculate retstart parameter
         retstart = (page - 1) * limit
         
-        # Search for PMIDs
-        search_url = f"{BASE_URL}/esearch.fcgi"
-        search_params = {
-            "db": "pubmed",
-            "term": query,
-            "retmode": "json",
-            "retmax": limit,
-            "retstart": retstart,
-            "sort": "relevance",  # Sort by relevance
-            "usehistory": "y"     # Use WebEnv and QueryKey for faster subsequent requests
-        }
-        
-        search_data = await fetch_with_retry(search_url, search_params)
+        # Run the search on the history server only; the page of summaries is
+        # then read straight from it, so the id list is never downloaded
+        search_result = await esearch(query, 0, 0)
         
-        if "esearchresult" not in search_data:
+        if search_result is None:
             return {"success": False, "error": "Invalid response from PubMed"}
         
-        # Get total count and PMIDs
-        count = int(search_data["esearchresult"].get("count", 0))
-        pmids = search_data["esearchresult"].get("idlist", [])
+        count = int(search_result.get("count", 0))
         
-        # Fetch paper details
-        papers = await fetch_paper_details(pmids)
+        # Fetch paper details for the requested page
+        papers = []
+        if retstart < count:
+            web_env = search_result.get("webenv", "")
+            query_key = search_result.get("querykey", "")
+            if not web_env or not query_key:
+                return {"success": False, "error": "Invalid response from PubMed"}
+            
+            papers = await fetch_paper_details_by_history(web_env, query_key, retstart, limit)
         
         # Return formatted results
         result = PubmedSearchResult(count=count, papers=papers)
-        return {"success": True, "data": json.loads(result.model_dump_json())}
+        return {"success": True, "data": result.model_dump(mode="json")}
         
     except Exception as e:
         logger.error(f"Error in pubmed_search: {str(e)}")
@@ -288,7 +432,7 @@ async def pubmed_similar(pmid: int) -> Dict:
         # Fetch paper details
         papers = await fetch_paper_details(similar_pmids)
         
-        return {"success": True, "data": [json.loads(paper.model_dump_json()) for paper in papers]}
+        return {"success": True, "data": [paper.model_dump(mode="json") for paper in papers]}
         
     except Exception as e:
         logger.error(f"Error in pubmed_similar: {str(e)}")
@@ -325,25 +469,10 @@ async def pubmed_cites(pmid: int) -> Dict:
         if not web_env or not query_key:
             return {"success": True, "data": []}
         
-        # Use the WebEnv and QueryKey to fetch the cited articles
-        search_url = f"{BASE_URL}/esearch.fcgi"
-        search_params = {
-            "db": "pubmed",
-            "term": "",
-            "WebEnv": web_env,
-            "query_key": query_key,
-            "retmode": "json",
-            "retmax": 200 if API_KEY else 100  # Increased limit with API key
-        }
-        
-        search_data = await fetch_with_retry(search_url, search_params)
+        # Read the cited articles' summaries straight from the history server
+        papers = await fetch_paper_details_by_history(web_env, query_key, 0, MAX_RESULTS)
         
-        cited_pmids = search_data.get("esearchresult", {}).get("idlist", [])
-        
-        # Fetch paper details
-        papers = await fetch_paper_details(cited_pmids)
-        
-        return {"success": True, "data": [json.loads(paper.model_dump_json()) for paper in papers]}
+        return {"success": True, "data": [paper.model_dump(mode="json") for paper in papers]}
         
     except Exception as e:
         logger.error(f"Error in pubmed_cites: {str(e)}")
@@ -380,25 +509,10 @@ async def pubmed_cited_by(pmid: int) -> Dict:
         if not web_env or not query_key:
             return {"success": True, "data": []}
         
-        # Use the WebEnv and QueryKey to fetch the citing articles
-        search_url = f"{BASE_URL}/esearch.fcgi"
-        search_params = {
-            "db": "pubmed",
-            "term": "",
-            "WebEnv": web_env,
-            "query_key": query_key,
-            "retmode": "json",
-            "retmax": 200 if API_KEY else 100  # Increased limit with API key
-        }
-        
-        search_data = await fetch_with_retry(search_url, search_params)
-        
-        citing_pmids = search_data.get("esearchresult", {}).get("idlist", [])
-        
-        # Fetch paper details
-        papers = await fetch_paper_details(citing_pmids)
+        # Read the citing articles' summaries straight from the history server
+        papers = await fetch_paper_details_by_history(web_env, query_key, 0, MAX_RESULTS)
         
-        return {"success": True, "data": [json.loads(paper.model_dump_json()) for paper in papers]}
+        return {"success": True, "data": [paper.model_dump(mode="json") for paper in papers]}
         
     except Exception as e:
         logger.error(f"Error in pubmed_cited_by: {str(e)}")
@@ -411,6 +525,9 @@ async def pubmed_abstract(pmid: int) -> Dict:
     Returns only the abstract text.
     """
     try:
+        if pmid in ABSTRACT_CACHE:
+            return {"success": True, "data": ABSTRACT_CACHE[pmid]}
+        
         # Use efetch to get the abstract
         efetch_url = f"{BASE_URL}/efetch.fcgi"
         efetch_params = {
@@ -422,29 +539,25 @@ async def pubmed_abstract(pmid: int) -> Dict:
         
         xml_content = await fetch_with_retry(efetch_url, efetch_params)
         
-        # Extract abstract from XML
-        import xml.etree.ElementTree as ET
+        # Extract abstract from XML; efetch abstract records are small, so a
+        # single compiled XPath over the parsed record is cheapest
         try:
-            root = ET.fromstring(xml_content)
+            root = LET.fromstring(xml_content, XML_PARSER)
             
-            # Look for abstract sections
-            abstract_sections = root.findall(".//Abstract/AbstractText")
-            if abstract_sections:
-                abstract_parts = []
-                for section in abstract_sections:
-                    label = section.get("Label", "")
-                    text = section.text or ""
-                    if label:
-                        abstract_parts.append(f"{label}: {text}")
-                    else:
-                        abstract_parts.append(text)
-                abstract = " ".join(abstract_parts)
-            else:
-                abstract = root.findtext(".//Abstract/AbstractText", default="")
+            abstract_parts = []
+            for section in ABSTRACT_XPATH(root):
+                label = section.get("Label", "")
+                text = section.text or ""
+                if label:
+                    abstract_parts.append(f"{label}: {text}")
+                else:
+                    abstract_parts.append(text)
+            abstract = " ".join(abstract_parts) or "No abstract available"
+            ABSTRACT_CACHE[pmid] = abstract
             
-            return {"success": True, "data": abstract or "No abstract available"}
+            return {"success": True, "data": abstract}
             
-        except ET.ParseError:
+        except LET.XMLSyntaxError:
             return {"success": False, "error": "Failed to parse XML response"}
             
     except Exception as e:
@@ -458,6 +571,9 @@ async def pubmed_open_access(pmid: int) -> Dict:
     Returns true if the article is open access, false otherwise.
     """
     try:
+        if pmid in OPEN_ACCESS_CACHE:
+            return {"success": True, "data": OPEN_ACCESS_CACHE[pmid]}
+        
         # Use elink to check for PMC links
         elink_url = f"{BASE_URL}/elink.fcgi"
         elink_params = {
@@ -482,6 +598,7 @@ async def pubmed_open_access(pmid: int) -> Dict:
         except (KeyError, IndexError):
             pass
         
+        OPEN_ACCESS_CACHE[pmid] = has_pmc
         return {"success": True, "data": has_pmc}
         
     except Exception as e:
@@ -495,36 +612,16 @@ async def pubmed_full_text(pmid: int) -> Dict:
     Please check if a PMID is open access before using this tool.
     """
     try:
-        # First check if it's open access
-        is_oa_result = await pubmed_open_access(pmid)
-        if not is_oa_result.get("success", False) or not is_oa_result.get("data", False):
-            return {"success": False, "error": "This article is not open access or not available in PMC"}
-        
-        # Get the PMC ID for this PMID
-        summary_url = f"{BASE_URL}/esummary.fcgi"
-        summary_params = {
-            "db": "pubmed",
-            "id": pmid,
-            "retmode": "json"
-        }
-        
-        summary_data = await fetch_with_retry(summary_url, summary_params)
-        
-        pmc_id = None
-        try:
-            article = summary_data["result"][str(pmid)]
-            articleids = article.get("articleids", [])
-            for id_obj in articleids:
-                if id_obj.get("idtype") == "pmc":
-                    pmc_value = id_obj.get("value", "")
-                    if pmc_value.startswith("PMC"):
-                        pmc_id = pmc_value
-                    break
-        except (KeyError, TypeError):
+        # An article has a PMC ID in its summary exactly when it is available
+        # in PMC, so one (usually cached) esummary lookup replaces the separate
+        # open-access check
+        papers = await fetch_paper_details([str(pmid)])
+        if not papers:
             return {"success": False, "error": "Failed to find PMC ID for this article"}
         
+        pmc_id = papers[0].pmc
         if not pmc_id:
-            return {"success": False, "error": "No PMC ID found for this article"}
+            return {"success": False, "error": "This article is not open access or not available in PMC"}
         
         # Use efetch to get the full text from PMC
         efetch_url = f"{BASE_URL}/efetch.fcgi"
@@ -537,29 +634,51 @@ async def pubmed_full_text(pmid: int) -> Dict:
         
         xml_content = await fetch_with_retry(efetch_url, efetch_params)
         
-        # Extract the article text
-        import xml.etree.ElementTree as ET
+        # Stream paragraphs out of the article body instead of building the whole tree
         try:
-            root = ET.fromstring(xml_content)
+            # Nested paragraphs (in captions, list items) end before the paragraph
+            # around them, so each in-body <p> reserves its slot when it starts
+            paragraphs = []
+            open_paragraphs = []
+            in_body = False
+            found_body = False
+            context = LET.iterparse(BytesIO(xml_content), events=("start", "end"), tag=("body", "p"), huge_tree=True)
+            for event, elem in context:
+                if elem.tag == "body":
+                    if event == "end":
+                        # Only the article's own (first) body counts; sub-articles
+                        # such as decision letters carry bodies of their own
+                        break
+                    in_body = True
+                    found_body = True
+                    continue
+                if event == "start":
+                    if in_body:
+                        paragraphs.append(None)
+                        open_paragraphs.append(len(paragraphs) - 1)
+                    else:
+                        open_paragraphs.append(None)
+                    continue
+                slot = open_paragraphs.pop()
+                if slot is not None:
+                    paragraphs[slot] = paragraph_text(elem).strip()
+                # Prune only outermost paragraphs; an enclosing one still needs its content
+                if not open_paragraphs:
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+            paragraphs = [text for text in paragraphs if text]
             
-            # Get the article body text
-            body = root.find(".//body")
-            if body is None:
+            if not found_body:
                 return {"success": False, "error": "Full text structure not found in PMC"}
             
-            # Extract text from all paragraphs
-            paragraphs = []
-            for p in body.findall(".//p"):
-                if p.text:
-                    paragraphs.append(p.text.strip())
-            
             if not paragraphs:
                 return {"success": False, "error": "No paragraphs found in the full text"}
             
             full_text = "\n\n".join(paragraphs)
             return {"success": True, "data": full_text}
             
-        except ET.ParseError:
+        except LET.XMLSyntaxError:
             return {"success": False, "error": "Failed to parse XML full text"}
             
     except Exception as e:
@@ -573,28 +692,63 @@ async def pubmed_batch_search(queries: List[str], limit: Optional[int] = None) -
     Returns results for each query in the same order as the input queries.
     """
     try:
-        limit = max(1, min(200 if API_KEY else 100, limit or 10))
+        limit = max(1, min(MAX_RESULTS, limit or 10))
         
-        # Create a task for each query
-        tasks = [pubmed_search(query, 1, limit) for query in queries]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Run every esearch concurrently; the rate limiter paces them
+        searches = await asyncio.gather(*[esearch(query, 0, limit) for query in queries], return_exceptions=True)
         
-        # Process results
+        # Resolve the PMIDs of all queries with one pooled esummary pass;
+        # fetch_paper_details drops the PMIDs that several queries share
+        idlists = [
+            search_result.get("idlist", []) if isinstance(search_result, dict) else []
+            for search_result in searches
+        ]
+        try:
+            papers = await fetch_paper_details([pmid for idlist in idlists for pmid in idlist])
+            paper_by_pmid = {str(paper.pmid): paper for paper in papers}
+            query_papers = [
+                [paper_by_pmid[pmid] for pmid in idlist if pmid in paper_by_pmid]
+                for idlist in idlists
+            ]
+        except Exception as e:
+            # Resolve each query on its own so a failed batch only fails the
+            # queries it belongs to; the batches that succeeded are cached
+            logger.warning(f"Pooled summary fetch failed, retrying per query: {str(e)}")
+            query_papers = await asyncio.gather(
+                *[fetch_paper_details(idlist) for idlist in idlists], return_exceptions=True
+            )
+        
+        # Reassemble the results for each query
         batch_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
+        for query, search_result, papers in zip(queries, searches, query_papers):
+            if isinstance(search_result, Exception):
+                batch_results.append({
+                    "query": query,
+                    "success": False,
+                    "error": str(search_result),
+                    "data": None
+                })
+            elif search_result is None:
                 batch_results.append({
-                    "query": queries[i],
+                    "query": query,
                     "success": False,
-                    "error": str(result),
+                    "error": "Invalid response from PubMed",
+                    "data": None
+                })
+            elif isinstance(papers, Exception):
+                batch_results.append({
+                    "query": query,
+                    "success": False,
+                    "error": str(papers),
                     "data": None
                 })
             else:
+                result = PubmedSearchResult(count=int(search_result.get("count", 0)), papers=papers)
                 batch_results.append({
-                    "query": queries[i],
-                    "success": result.get("success", False),
-                    "error": result.get("error", None),
-                    "data": result.get("data", None)
+                    "query": query,
+                    "success": True,
+                    "error": None,
+                    "data": result.model_dump(mode="json")
                 })
         
         return {"success": True, "data": batch_results}
@@ -610,8 +764,8 @@ async def pubmed_author_search(author: str, limit: Optional[int] = None) -> Dict
     The author name should be in the format "Last Name, First Initial" (e.g., "Smith, J")
     """
     try:
-        # Format author name for search
-        formatted_author = f"{author}[Author]"
+        # Format author name for search, unless it is already tagged
+        formatted_author = author if FIELD_TAG.search(author) else f"{author}[Author]"
         return await pubmed_search(formatted_author, 1, limit)
         
     except Exception as e:
@@ -634,26 +788,10 @@ async def pubmed_advanced_search(params: Dict[str, str], limit: Optional[int] =
     """
     try:
         # Build advanced query
-        query_parts = []
-        
-        field_mappings = {
-            "author": "[Author]",
-            "journal": "[Journal]",
-            "year": "[Publication Date]",
-            "title": "[Title]",
-            "mesh": "[MeSH Terms]",
-            "affiliation": "[Affiliation]",
-            "doi": "[DOI]",
-            "keyword": "[Keyword]"
-        }
-        
-        for field, value in params.items():
-            if field in field_mappings:
-                query_parts.append(f"{value}{field_mappings[field]}")
-            else:
-                query_parts.append(value)
-        
-        query = " AND ".join(query_parts)
+        query = " AND ".join(
+            f"{value}{FIELD_MAPPINGS[field]}" if field in FIELD_MAPPINGS else value
+            for field, value in params.items()
+        )
         return await pubmed_search(query, 1, limit)
         
     except Exception as e:
@@ -689,13 +827,19 @@ def load_config(config_path):
         
     try:
         with open(config_path, 'r') as f:
-            import json
             return json.load(f)
     except Exception as e:
         logger.error(f"Error loading config file: {str(e)}")
         return {}
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop where it is installed (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Parse command line arguments
     args = parse_arguments()
     
@@ -713,6 +857,11 @@ if __name__ == "__main__":
     elif config.get("email"):
         EMAIL = config.get("email")
     
+    # The rate and result limits depend on whether an API key was supplied
+    API_REQUESTS_PER_SECOND = 10 if API_KEY else 3
+    API_RATE_LIMITER = AsyncLimiter(API_REQUESTS_PER_SECOND, 1)
+    MAX_RESULTS = 200 if API_KEY else 100
+    
     # Display API key and email status
     if API_KEY:
         logger.info(f"PubMed API Key detected: Using enhanced limits (10 req/sec, 200 results max)")
@@ -731,11 +880,3 @@ if __name__ == "__main__":
         mcp.run()
     except KeyboardInterrupt:
         logger.info("Server interrupted, shutting down...")
-    finally:
-        # Create a loop to run the session cleanup
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(close_session())
-        finally:
-            loop.close()
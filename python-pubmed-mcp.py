@@ -5,12 +5,18 @@ Similar to the Node.js implementation but using Python libraries.
 """
 
 import asyncio
-import json
 import logging
+import os
 import sys
-from typing import Dict, List, Optional, Any, Union
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Any, Tuple
 import aiohttp
-from pydantic import BaseModel, Field, validator
+import anyio
+import msgspec
+import orjson
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+from lxml import etree
 from mcp.server.fastmcp import FastMCP
 
 # Configure logging
@@ -21,19 +27,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger("pubmed-mcp")
 
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the HTTP session when the server stops, on the loop that owns its connections."""
+    try:
+        yield
+    finally:
+        # Shielded so the close still completes when shutdown cancels the server
+        with anyio.CancelScope(shield=True):
+            await close_session()
+
 # Initialize MCP server
-mcp = FastMCP("pubmed-mcp")
+mcp = FastMCP("pubmed-mcp", lifespan=lifespan)
 
 # Define constants
 BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+ESEARCH_URL = f"{BASE_URL}/esearch.fcgi"
+ESUMMARY_URL = f"{BASE_URL}/esummary.fcgi"
+ELINK_URL = f"{BASE_URL}/elink.fcgi"
+EFETCH_URL = f"{BASE_URL}/efetch.fcgi"
 PUBMED_URL = "https://pubmed.ncbi.nlm.nih.gov"
 PMC_URL = "https://www.ncbi.nlm.nih.gov/pmc/articles"
 
+# Optional NCBI API key, read from the NCBI_API_KEY environment variable
+API_KEY = os.environ.get("NCBI_API_KEY", "")
+
+# NCBI allows 10 requests per second with an API key and 3 without; the
+# limiter paces request starts and the session's connector caps requests in flight
+API_REQUESTS_PER_SECOND = 10 if API_KEY else 3
+API_RATE_LIMITER = AsyncLimiter(API_REQUESTS_PER_SECOND, 1)
+
+# XML parsing objects shared by every call
+XML_PARSER = etree.XMLParser(huge_tree=True, remove_blank_text=True)
+ABSTRACT_XPATH = etree.XPath(".//Abstract/AbstractText")
+
+# JATS block elements that can sit inside a <p> without being part of its prose
+PARAGRAPH_BLOCK_TAGS = frozenset({
+    "p", "fig", "fig-group", "table-wrap", "table-wrap-group", "list", "def-list",
+    "disp-quote", "disp-formula", "disp-formula-group", "boxed-text", "statement",
+    "supplementary-material", "chem-struct-wrap", "preformat", "code", "speech", "verse-group"
+})
+
 # Global HTTP session
 session = None
 
+# Recent raw E-utilities response bodies, bounded by their total size in bytes,
+# and requests that are currently in flight. Only the endpoints keyed by PMID are
+# cached; searches are always sent so newly indexed papers show up
+RESPONSE_CACHE_BYTES = 64 * 1024 * 1024
+RESPONSE_CACHE = TTLCache(maxsize=RESPONSE_CACHE_BYTES, ttl=3600, getsizeof=lambda response: len(response[1]))
+IN_FLIGHT_REQUESTS: Dict[Tuple, asyncio.Future] = {}
+
 # Define data models
-class PubmedPaper(BaseModel):
+class PubmedPaper(msgspec.Struct):
     """Model for a PubMed paper."""
     title: str
     authors: str
@@ -42,7 +88,7 @@ class PubmedPaper(BaseModel):
     pmc: Optional[int] = None
     doi: Optional[str] = None
 
-class PubmedSearchResult(BaseModel):
+class PubmedSearchResult(msgspec.Struct):
     """Model for PubMed search results."""
     count: int
     papers: List[PubmedPaper]
@@ -53,7 +99,20 @@ async def get_session() -> aiohttp.ClientSession:
     global session
     if session is None or session.closed:
         timeout = aiohttp.ClientTimeout(total=30)
-        session = aiohttp.ClientSession(timeout=timeout)
+        # All E-utilities traffic goes to a single host, so keep connections
+        # and DNS lookups warm instead of paying a TLS handshake per request
+        connector = aiohttp.TCPConnector(
+            limit=20,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={"Accept-Encoding": "gzip"}
+        )
     return session
 
 async def close_session() -> None:
@@ -63,24 +122,77 @@ async def close_session() -> None:
         await session.close()
         session = None
 
-async def fetch_with_retry(url: str, params: Dict, max_retries: int = 3) -> Any:
-    """Fetch data from URL with retry logic."""
+async def fetch_with_retry(url: str, params: Dict, max_retries: int = 3, method: str = "GET") -> Any:
+    """
+    Fetch data from URL with retry logic. Repeated requests to the PMID-keyed endpoints
+    (esummary, elink, efetch) are served from the response cache; searches are never
+    cached. Concurrent identical requests share a single network call.
+    """
+    key = (method, url, tuple(sorted((name, str(value)) for name, value in params.items())))
+    response = RESPONSE_CACHE.get(key)
+    if response is None:
+        task = IN_FLIGHT_REQUESTS.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch_with_retry_uncached(url, params, max_retries, method))
+            IN_FLIGHT_REQUESTS[key] = task
+            cacheable = url in (ESUMMARY_URL, ELINK_URL, EFETCH_URL)
+            task.add_done_callback(lambda done: store_response(key, done, cacheable))
+        
+        # Shield the shared request so one caller being cancelled doesn't cancel it for the others
+        response = await asyncio.shield(task)
+    
+    return decode_body(*response)
+
+def with_api_key(params: Dict) -> Dict:
+    """Return the request parameters with the NCBI API key added, if one is configured."""
+    if API_KEY:
+        return {**params, "api_key": API_KEY}
+    return params
+
+def store_response(key: Tuple, task: asyncio.Future, cacheable: bool) -> None:
+    """Move a finished request out of the in-flight map, caching it if it succeeded."""
+    IN_FLIGHT_REQUESTS.pop(key, None)
+    if cacheable and not task.cancelled() and task.exception() is None:
+        response = task.result()
+        # A body larger than the whole cache can't be stored, so it just isn't cached
+        if len(response[1]) <= RESPONSE_CACHE_BYTES:
+            RESPONSE_CACHE[key] = response
+
+async def read_body(response: aiohttp.ClientResponse) -> Tuple[str, bytes]:
+    """Return the Content-Type and raw body of a response."""
+    return response.headers.get("Content-Type", ""), await response.read()
+
+def decode_body(content_type: str, body: bytes) -> Any:
+    """Decode a JSON response body with orjson; anything else is returned as bytes."""
+    if "application/json" in content_type:
+        return orjson.loads(body)
+    # Anything else (XML) stays raw bytes so lxml can parse it without a decode
+    return body
+
+async def fetch_with_retry_uncached(url: str, params: Dict, max_retries: int = 3, method: str = "GET",
+                                    read_response: Callable[[aiohttp.ClientResponse], Awaitable[Any]] = read_body) -> Any:
+    """
+    Fetch data from URL with retry logic, returning what read_response makes of the
+    response. POST requests send the parameters as form data.
+    """
     session = await get_session()
     retry_count = 0
     backoff = 1
     
+    params = with_api_key(params)
+    if method == "POST":
+        request_kwargs = {"data": params}
+    else:
+        request_kwargs = {"params": params}
+    
     while retry_count < max_retries:
         try:
-            async with session.get(url, params=params) as response:
+            # Only an attempt's start consumes a rate-limit token; the session's
+            # connector (limit_per_host) caps how many requests are in flight
+            await API_RATE_LIMITER.acquire()
+            async with session.request(method, url, **request_kwargs) as response:
                 response.raise_for_status()
-                content_type = response.headers.get("Content-Type", "")
-                
-                if "application/json" in content_type:
-                    return await response.json()
-                elif "text/xml" in content_type or "application/xml" in content_type:
-                    return await response.text()
-                else:
-                    return await response.read()
+                return await read_response(response)
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             retry_count += 1
             if retry_count >= max_retries:
@@ -89,29 +201,93 @@ async def fetch_with_retry(url: str, params: Dict, max_retries: int = 3) -> Any:
             await asyncio.sleep(backoff)
             backoff *= 2
 
-def extract_pubmed_papers(data: Dict) -> List[PubmedPaper]:
-    """Extract PubMed papers from API response."""
-    papers = []
-    if "esearchresult" not in data or "idlist" not in data["esearchresult"]:
-        return papers
+async def read_body_paragraphs(response: aiohttp.ClientResponse) -> Optional[List[str]]:
+    """
+    Stream a PMC article through lxml and return the text of its body paragraphs,
+    or None if it has no body. Handled paragraphs are cleared straight away so only
+    the document skeleton stays in memory.
+    """
+    parser = etree.XMLPullParser(events=("start", "end"), tag=("body", "p"), huge_tree=True)
+    # Nested paragraphs (in captions, list items) end before the paragraph
+    # around them, so each in-body <p> reserves its slot when it starts
+    paragraphs = []
+    open_paragraphs = []
+    in_body = False
     
-    pmids = data["esearchresult"]["idlist"]
-    return papers
+    def handle_events() -> bool:
+        """Collect the paragraphs parsed so far; True once the article body has ended."""
+        nonlocal in_body
+        for event, elem in parser.read_events():
+            if elem.tag == "body":
+                if event == "end":
+                    # Only the article's own (first) body counts; sub-articles
+                    # such as decision letters carry bodies of their own
+                    return True
+                in_body = True
+                continue
+            if event == "start":
+                if in_body:
+                    paragraphs.append(None)
+                    open_paragraphs.append(len(paragraphs) - 1)
+                else:
+                    open_paragraphs.append(None)
+                continue
+            slot = open_paragraphs.pop()
+            if slot is not None:
+                paragraphs[slot] = paragraph_text(elem).strip()
+            # Prune only outermost paragraphs; an enclosing one still needs its content
+            if not open_paragraphs:
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        return False
+    
+    async for chunk in response.content.iter_chunked(65536):
+        parser.feed(chunk)
+        if handle_events():
+            return [text for text in paragraphs if text]
+    parser.close()
+    return [text for text in paragraphs if text] if handle_events() else None
+
+def paragraph_text(elem: Any) -> str:
+    """
+    Return the text of a paragraph element, keeping inline markup such as <italic>
+    or <xref> but leaving out block descendants like figures, tables and lists.
+    """
+    parts = [elem.text or ""]
+    for child in elem:
+        if isinstance(child.tag, str) and child.tag not in PARAGRAPH_BLOCK_TAGS:
+            parts.append(paragraph_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+def format_abstract_section(section: Any) -> str:
+    """Format an AbstractText element, prefixed with its label if it has one."""
+    label = section.get("Label", "")
+    text = section.text or ""
+    return f"{label}: {text}" if label else text
 
 async def fetch_paper_details(pmids: List[str]) -> List[PubmedPaper]:
     """Fetch details for a list of PubMed IDs."""
     if not pmids:
         return []
     
-    # Fetch summary data for the PMIDs
-    summary_url = f"{BASE_URL}/esummary.fcgi"
-    summary_params = {
-        "db": "pubmed",
-        "id": ",".join(pmids),
-        "retmode": "json"
-    }
+    # Fetch summary data for the PMIDs in concurrent batches of 200; larger
+    # batches are POSTed so the id list doesn't have to fit in the URL
+    batch_size = 200
+    batches = [pmids[i:i+batch_size] for i in range(0, len(pmids), batch_size)]
+    summaries = await asyncio.gather(*[
+        fetch_with_retry(
+            ESUMMARY_URL,
+            {"db": "pubmed", "id": ",".join(batch_pmids), "retmode": "json"},
+            method="POST" if len(batch_pmids) > 100 else "GET"
+        )
+        for batch_pmids in batches
+    ])
     
-    summary_data = await fetch_with_retry(summary_url, summary_params)
+    summary_data = {"result": {}}
+    for batch_data in summaries:
+        summary_data["result"].update(batch_data.get("result", {}))
     
     papers = []
     for pmid in pmids:
@@ -119,31 +295,29 @@ async def fetch_paper_details(pmids: List[str]) -> List[PubmedPaper]:
             article = summary_data["result"][pmid]
             
             # Extract authors
-            authors = []
-            for author in article.get("authors", []):
-                if author.get("authtype") == "Author" and "name" in author:
-                    authors.append(author["name"])
+            authors = [
+                author["name"]
+                for author in article.get("authors", ())
+                if author.get("authtype") == "Author" and "name" in author
+            ]
             
             authors_str = ", ".join(authors) if authors else "N/A"
             
-            # Extract DOI
+            # Extract DOI and PMC ID in a single pass over the article IDs
             doi = None
-            articleids = article.get("articleids", [])
-            for id_obj in articleids:
-                if id_obj.get("idtype") == "doi":
-                    doi = id_obj.get("value")
-                    break
-            
-            # Extract PMC ID
             pmc = None
-            for id_obj in articleids:
-                if id_obj.get("idtype") == "pmc":
+            for id_obj in article.get("articleids", ()):
+                idtype = id_obj.get("idtype")
+                if idtype == "doi" and doi is None:
+                    doi = id_obj.get("value")
+                elif idtype == "pmc" and pmc is None:
                     pmc_value = id_obj.get("value", "")
                     if pmc_value.startswith("PMC"):
                         try:
                             pmc = int(pmc_value[3:])
                         except ValueError:
                             pass
+                if doi is not None and pmc is not None:
                     break
             
             paper = PubmedPaper(
@@ -158,6 +332,47 @@ async def fetch_paper_details(pmids: List[str]) -> List[PubmedPaper]:
     
     return papers
 
+async def fetch_linked_papers(pmid: int, linkname: str, limit: int = 100) -> List[PubmedPaper]:
+    """Fetch details for the articles linked to a PMID through the given elink linkname."""
+    # Use elink to store the linked articles on the history server
+    elink_params = {
+        "db": "pubmed",
+        "cmd": "neighbor_history",
+        "id": pmid,
+        "linkname": linkname,
+        "retmode": "json"
+    }
+    
+    elink_data = await fetch_with_retry(ELINK_URL, elink_params)
+    
+    # Get the WebEnv and QueryKey
+    try:
+        link_sets = elink_data.get("linksets", [])
+        web_env = link_sets[0].get("webenv", "")
+        query_key = link_sets[0].get("linksetdbhistory", [{}])[0].get("querykey", "")
+    except (KeyError, IndexError):
+        return []
+    
+    if not web_env or not query_key:
+        return []
+    
+    # Use the WebEnv and QueryKey to fetch the linked articles
+    search_params = {
+        "db": "pubmed",
+        "term": "",
+        "WebEnv": web_env,
+        "query_key": query_key,
+        "retmode": "json",
+        "retmax": limit
+    }
+    
+    search_data = await fetch_with_retry(ESEARCH_URL, search_params)
+    
+    linked_pmids = search_data.get("esearchresult", {}).get("idlist", [])
+    
+    # Fetch paper details
+    return await fetch_paper_details(linked_pmids)
+
 # MCP Tool implementations
 @mcp.tool()
 async def pubmed_search(query: str, page: Optional[int] = None, limit: Optional[int] = None) -> Dict:
@@ -176,7 +391,6 @@ async def pubmed_search(query: str, page: Optional[int] = None, limit: Optional[
         retstart = (page - 1) * limit
         
         # Search for PMIDs
-        search_url = f"{BASE_URL}/esearch.fcgi"
         search_params = {
             "db": "pubmed",
             "term": query,
@@ -185,21 +399,23 @@ async def pubmed_search(query: str, page: Optional[int] = None, limit: Optional[
             "retstart": retstart
         }
         
-        search_data = await fetch_with_retry(search_url, search_params)
+        search_data = await fetch_with_retry(ESEARCH_URL, search_params)
         
-        if "esearchresult" not in search_data:
+        search_result = search_data.get("esearchresult")
+        if search_result is None:
             return {"success": False, "error": "Invalid response from PubMed"}
         
-        # Get total count and PMIDs
-        count = int(search_data["esearchresult"].get("count", 0))
-        pmids = search_data["esearchresult"].get("idlist", [])
+        # Get total count and PMIDs from the one esearch response; a separate
+        # rettype=count request would cost an extra round-trip
+        count = int(search_result.get("count", 0))
+        pmids = search_result.get("idlist", [])
         
         # Fetch paper details
         papers = await fetch_paper_details(pmids)
         
         # Return formatted results
         result = PubmedSearchResult(count=count, papers=papers)
-        return {"success": True, "data": json.loads(result.json())}
+        return {"success": True, "data": msgspec.to_builtins(result)}
         
     except Exception as e:
         logger.error(f"Error in pubmed_search: {str(e)}")
@@ -214,7 +430,6 @@ async def pubmed_similar(pmid: int) -> Dict:
     """
     try:
         # Use elink to find similar articles
-        elink_url = f"{BASE_URL}/elink.fcgi"
         elink_params = {
             "db": "pubmed",
             "cmd": "neighbor_score",
@@ -222,7 +437,7 @@ async def pubmed_similar(pmid: int) -> Dict:
             "retmode": "json"
         }
         
-        elink_data = await fetch_with_retry(elink_url, elink_params)
+        elink_data = await fetch_with_retry(ELINK_URL, elink_params)
         
         # Extract similar article PMIDs
         similar_pmids = []
@@ -239,7 +454,7 @@ async def pubmed_similar(pmid: int) -> Dict:
         # Fetch paper details
         papers = await fetch_paper_details(similar_pmids)
         
-        return {"success": True, "data": [json.loads(paper.json()) for paper in papers]}
+        return {"success": True, "data": [msgspec.to_builtins(paper) for paper in papers]}
         
     except Exception as e:
         logger.error(f"Error in pubmed_similar: {str(e)}")
@@ -253,48 +468,8 @@ async def pubmed_cites(pmid: int) -> Dict:
     including: titles, authors, publication dates, PMIDs, PMCs, and DOIs.
     """
     try:
-        # Use elink to find cited articles
-        elink_url = f"{BASE_URL}/elink.fcgi"
-        elink_params = {
-            "db": "pubmed",
-            "cmd": "neighbor_history",
-            "id": pmid,
-            "linkname": "pubmed_pubmed_refs",
-            "retmode": "json"
-        }
-        
-        elink_data = await fetch_with_retry(elink_url, elink_params)
-        
-        # Get the WebEnv and QueryKey
-        try:
-            link_sets = elink_data.get("linksets", [])
-            web_env = link_sets[0].get("webenv", "")
-            query_key = link_sets[0].get("linksetdbhistory", [{}])[0].get("querykey", "")
-        except (KeyError, IndexError):
-            return {"success": True, "data": []}
-        
-        if not web_env or not query_key:
-            return {"success": True, "data": []}
-        
-        # Use the WebEnv and QueryKey to fetch the cited articles
-        search_url = f"{BASE_URL}/esearch.fcgi"
-        search_params = {
-            "db": "pubmed",
-            "term": "",
-            "WebEnv": web_env,
-            "query_key": query_key,
-            "retmode": "json",
-            "retmax": 100
-        }
-        
-        search_data = await fetch_with_retry(search_url, search_params)
-        
-        cited_pmids = search_data.get("esearchresult", {}).get("idlist", [])
-        
-        # Fetch paper details
-        papers = await fetch_paper_details(cited_pmids)
-        
-        return {"success": True, "data": [json.loads(paper.json()) for paper in papers]}
+        papers = await fetch_linked_papers(pmid, "pubmed_pubmed_refs")
+        return {"success": True, "data": [msgspec.to_builtins(paper) for paper in papers]}
         
     except Exception as e:
         logger.error(f"Error in pubmed_cites: {str(e)}")
@@ -308,48 +483,8 @@ async def pubmed_cited_by(pmid: int) -> Dict:
     including: titles, authors, publication dates, PMIDs, PMCs, and DOIs.
     """
     try:
-        # Use elink to find articles that cite this article
-        elink_url = f"{BASE_URL}/elink.fcgi"
-        elink_params = {
-            "db": "pubmed",
-            "cmd": "neighbor_history",
-            "id": pmid,
-            "linkname": "pubmed_pubmed_citedin",
-            "retmode": "json"
-        }
-        
-        elink_data = await fetch_with_retry(elink_url, elink_params)
-        
-        # Get the WebEnv and QueryKey
-        try:
-            link_sets = elink_data.get("linksets", [])
-            web_env = link_sets[0].get("webenv", "")
-            query_key = link_sets[0].get("linksetdbhistory", [{}])[0].get("querykey", "")
-        except (KeyError, IndexError):
-            return {"success": True, "data": []}
-        
-        if not web_env or not query_key:
-            return {"success": True, "data": []}
-        
-        # Use the WebEnv and QueryKey to fetch the citing articles
-        search_url = f"{BASE_URL}/esearch.fcgi"
-        search_params = {
-            "db": "pubmed",
-            "term": "",
-            "WebEnv": web_env,
-            "query_key": query_key,
-            "retmode": "json",
-            "retmax": 100
-        }
-        
-        search_data = await fetch_with_retry(search_url, search_params)
-        
-        citing_pmids = search_data.get("esearchresult", {}).get("idlist", [])
-        
-        # Fetch paper details
-        papers = await fetch_paper_details(citing_pmids)
-        
-        return {"success": True, "data": [json.loads(paper.json()) for paper in papers]}
+        papers = await fetch_linked_papers(pmid, "pubmed_pubmed_citedin")
+        return {"success": True, "data": [msgspec.to_builtins(paper) for paper in papers]}
         
     except Exception as e:
         logger.error(f"Error in pubmed_cited_by: {str(e)}")
@@ -363,7 +498,6 @@ async def pubmed_abstract(pmid: int) -> Dict:
     """
     try:
         # Use efetch to get the abstract
-        efetch_url = f"{BASE_URL}/efetch.fcgi"
         efetch_params = {
             "db": "pubmed",
             "id": pmid,
@@ -371,31 +505,17 @@ async def pubmed_abstract(pmid: int) -> Dict:
             "rettype": "abstract"
         }
         
-        xml_content = await fetch_with_retry(efetch_url, efetch_params)
+        xml_content = await fetch_with_retry(EFETCH_URL, efetch_params)
         
-        # Extract abstract from XML
-        import xml.etree.ElementTree as ET
+        # Extract abstract from XML; efetch abstract records are small, so one
+        # compiled XPath over the parsed record is cheapest
         try:
-            root = ET.fromstring(xml_content)
-            
-            # Look for abstract sections
-            abstract_sections = root.findall(".//Abstract/AbstractText")
-            if abstract_sections:
-                abstract_parts = []
-                for section in abstract_sections:
-                    label = section.get("Label", "")
-                    text = section.text or ""
-                    if label:
-                        abstract_parts.append(f"{label}: {text}")
-                    else:
-                        abstract_parts.append(text)
-                abstract = " ".join(abstract_parts)
-            else:
-                abstract = root.findtext(".//Abstract/AbstractText", default="")
+            root = etree.fromstring(xml_content, XML_PARSER)
+            abstract = " ".join(format_abstract_section(section) for section in ABSTRACT_XPATH(root))
             
             return {"success": True, "data": abstract or "No abstract available"}
             
-        except ET.ParseError:
+        except etree.XMLSyntaxError:
             return {"success": False, "error": "Failed to parse XML response"}
             
     except Exception as e:
@@ -410,7 +530,6 @@ async def pubmed_open_access(pmid: int) -> Dict:
     """
     try:
         # Use elink to check for PMC links
-        elink_url = f"{BASE_URL}/elink.fcgi"
         elink_params = {
             "db": "pubmed",
             "dbfrom": "pubmed",
@@ -419,7 +538,7 @@ async def pubmed_open_access(pmid: int) -> Dict:
             "retmode": "json"
         }
         
-        elink_data = await fetch_with_retry(elink_url, elink_params)
+        elink_data = await fetch_with_retry(ELINK_URL, elink_params)
         
         # Check for PMC links
         has_pmc = False
@@ -446,20 +565,15 @@ async def pubmed_full_text(pmid: int) -> Dict:
     Please check if a PMID is open access before using this tool.
     """
     try:
-        # First check if it's open access
-        is_oa_result = await pubmed_open_access(pmid)
-        if not is_oa_result.get("success", False) or not is_oa_result.get("data", False):
-            return {"success": False, "error": "This article is not open access or not available in PMC"}
-        
-        # Get the PMC ID for this PMID
-        summary_url = f"{BASE_URL}/esummary.fcgi"
+        # Get the PMC ID for this PMID; an article has one exactly when it is
+        # available in PMC, so this also serves as the open access check
         summary_params = {
             "db": "pubmed",
             "id": pmid,
             "retmode": "json"
         }
         
-        summary_data = await fetch_with_retry(summary_url, summary_params)
+        summary_data = await fetch_with_retry(ESUMMARY_URL, summary_params)
         
         pmc_id = None
         try:
@@ -475,10 +589,9 @@ async def pubmed_full_text(pmid: int) -> Dict:
             return {"success": False, "error": "Failed to find PMC ID for this article"}
         
         if not pmc_id:
-            return {"success": False, "error": "No PMC ID found for this article"}
+            return {"success": False, "error": "This article is not open access or not available in PMC"}
         
         # Use efetch to get the full text from PMC
-        efetch_url = f"{BASE_URL}/efetch.fcgi"
         efetch_params = {
             "db": "pmc",
             "id": pmc_id,
@@ -486,31 +599,22 @@ async def pubmed_full_text(pmid: int) -> Dict:
             "rettype": "full"
         }
         
-        xml_content = await fetch_with_retry(efetch_url, efetch_params)
-        
-        # Extract the article text
-        import xml.etree.ElementTree as ET
+        # Stream the XML and pick out the body paragraphs as they arrive
         try:
-            root = ET.fromstring(xml_content)
+            paragraphs = await fetch_with_retry_uncached(
+                EFETCH_URL, efetch_params, read_response=read_body_paragraphs
+            )
             
-            # Get the article body text
-            body = root.find(".//body")
-            if body is None:
+            if paragraphs is None:
                 return {"success": False, "error": "Full text structure not found in PMC"}
             
-            # Extract text from all paragraphs
-            paragraphs = []
-            for p in body.findall(".//p"):
-                if p.text:
-                    paragraphs.append(p.text.strip())
-            
             if not paragraphs:
                 return {"success": False, "error": "No paragraphs found in the full text"}
             
             full_text = "\n\n".join(paragraphs)
             return {"success": True, "data": full_text}
             
-        except ET.ParseError:
+        except etree.XMLSyntaxError:
             return {"success": False, "error": "Failed to parse XML full text"}
             
     except Exception as e:
@@ -518,17 +622,16 @@ async def pubmed_full_text(pmid: int) -> Dict:
         return {"success": False, "error": str(e)}
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop where it is installed (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     try:
         # The FastMCP implementation doesn't have an async run method
         # We'll use the synchronous run method instead
         mcp.run()
     except KeyboardInterrupt:
         logger.info("Server interrupted, shutting down...")
-    finally:
-        # Create a loop to run the session cleanup
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(close_session())
-        finally:
-            loop.close()
@@ -7,8 +7,12 @@ This script helps users set up their NCBI API key and email for the PubMed MCP S
 import os
 import json
 import argparse
+import re
 import sys
 
+# Simple pattern used to sanity-check email addresses
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+
 def print_color(text, color="green"):
     """Print colored text to the console."""
     colors = {
@@ -26,9 +30,7 @@ def print_color(text, color="green"):
 
 def validate_email(email):
     """Simple email validation."""
-    import re
-    pattern = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-    return re.match(pattern, email) is not None
+    return EMAIL_PATTERN.match(email) is not None
 
 def save_config(api_key, email, config_file="config.json"):
     """Save API key and email to config file."""
@@ -0,0 +1,83 @@
+"""Full-text paragraph extraction against a PMC article with nested paragraphs."""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# A body paragraph holding a figure, one holding a list, and one holding a table,
+# followed by back matter and a sub-article whose paragraphs must be left out
+NESTED_ARTICLE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<pmc-articleset><article>
+<front><p>Front matter</p></front>
+<body><sec><title>Results</title>
+<p>Expression rose <italic>sharply</italic> (<xref ref-type="fig" rid="f1">Figure 1</xref>).<fig id="f1"><label>Figure 1</label><caption><p>Caption text.</p></caption></fig></p>
+<p>Patients met these criteria:<list><list-item><p>age over 18;</p></list-item><list-item><p>consent given.</p></list-item></list></p>
+<p>Values are listed in <table-wrap><label>Table 1</label><table><tr><td>cell</td></tr></table></table-wrap>the table.</p>
+</sec></body>
+<back><p>Back matter</p></back>
+<sub-article><body><p>Decision letter.</p></body></sub-article>
+</article></pmc-articleset>"""
+
+EXPECTED_TEXT = "\n\n".join([
+    "Expression rose sharply (Figure 1).",
+    "Caption text.",
+    "Patients met these criteria:",
+    "age over 18;",
+    "consent given.",
+    "Values are listed in the table.",
+])
+
+
+def load_server(filename):
+    """Import one of the server scripts, whose file names aren't valid module names."""
+    spec = importlib.util.spec_from_file_location(filename.replace("-", "_")[:-3], ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def enhanced_server(monkeypatch):
+    server = load_server("python-pubmed-mcp-enhanced.py")
+
+    async def fetch_paper_details(pmids):
+        return [server.PubmedPaper(title="T", authors="A", pubDate="2024", pmid=1, pmc="PMC1")]
+
+    async def fetch_with_retry(url, params, max_retries=3):
+        return NESTED_ARTICLE
+
+    monkeypatch.setattr(server, "fetch_paper_details", fetch_paper_details)
+    monkeypatch.setattr(server, "fetch_with_retry", fetch_with_retry)
+    return server
+
+
+def test_enhanced_full_text_keeps_document_order_and_skips_blocks(enhanced_server):
+    result = asyncio.run(enhanced_server.pubmed_full_text(1))
+    assert result == {"success": True, "data": EXPECTED_TEXT}
+
+
+class ChunkedContent:
+    """Stands in for aiohttp's StreamReader, feeding the article in small chunks."""
+
+    def __init__(self, body, size):
+        self.body = body
+        self.size = size
+
+    async def iter_chunked(self, n):
+        for start in range(0, len(self.body), self.size):
+            yield self.body[start:start + self.size]
+
+
+class FakeResponse:
+    def __init__(self, body, size=16):
+        self.content = ChunkedContent(body, size)
+
+
+def test_basic_read_body_paragraphs_keeps_document_order_and_skips_blocks():
+    server = load_server("python-pubmed-mcp.py")
+    paragraphs = asyncio.run(server.read_body_paragraphs(FakeResponse(NESTED_ARTICLE)))
+    assert "\n\n".join(paragraphs) == EXPECTED_TEXT